@@ -7,6 +7,11 @@ import time
 
 MAX_CHANNELS = 8
 
+# Single cached Struct for 32-bit command frames; avoids per-call format
+# parsing and attribute lookups inside struct.pack_into.
+_U32 = struct.Struct('>I')
+_pack32 = _U32.pack_into
+
 # Command Definitions
 CMD_WRITE_INPUT_REGISTER = const(0x00)  # Write to Input Register n
 CMD_UPDATE_DAC = const(0x01)  # Update DAC Register n
@@ -51,42 +56,166 @@ except ImportError:
     pass
 
 
+class _Batch:
+    """Context manager keeping a driver's SPI device open across calls."""
+
+    def __init__(self, owner):
+        self._owner = owner
+
+    def __enter__(self):
+        self._owner._dev = self._owner.spi_device.__enter__()
+        return self._owner
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._owner._dev = None
+        return self._owner.spi_device.__exit__(exc_type, exc_val, exc_tb)
+
+
 class AD5628:
 
+    # Constant command frames, prebuilt so these calls involve no
+    # arithmetic or allocation.
+    _RESET_CMD = (CMD_RESET << 24).to_bytes(4, 'big')
+    _PWRDN_CMD = (CMD_POWER_DOWN << 24).to_bytes(4, 'big')
+    _IREF_ON_CMD = ((CMD_SETUP_INT_REF_REG << 24) | (IREF_MODE['ON'] << 8)).to_bytes(4, 'big')
+
     def __init__(
-        self, spi: SPI, cs: DigitalInOut  # pylint: disable=invalid-name
+        self, spi: SPI, cs: DigitalInOut, ldac: DigitalInOut = None,  # pylint: disable=invalid-name
+        baudrate: int = 50000000
     ) -> None:
-        self.spi_device = SPIDevice(spi, cs, baudrate=50000000, polarity=0, phase=1)
+        self.spi_device = SPIDevice(spi, cs, baudrate=baudrate, polarity=0, phase=1)
+        # The port rounds the requested clock down to an available
+        # divisor, sometimes far below what was asked for; make that
+        # throughput cliff visible instead of silent.
+        if spi.try_lock():
+            try:
+                spi.configure(baudrate=baudrate, polarity=0, phase=1)
+                actual = getattr(spi, 'frequency', None)
+            finally:
+                spi.unlock()
+            if actual is not None and actual < 0.8 * baudrate:
+                print(f"Warning: SPI clock is {actual} Hz, well below the requested {baudrate} Hz")
+        # Optional LDAC pin (active low); lets write_all_channels_atomic
+        # commit every output with a single hardware pulse.
+        self.ldac = ldac
+        if ldac is not None:
+            ldac.switch_to_output(value=True)
+        # Reused transmit buffer so the hot path never allocates.
+        self._tx = bytearray(4)
+        self._pack = _pack32
+        # Set while a batch() is active; send_data reuses it instead of
+        # re-entering the SPI device per call.
+        self._dev = None
+        # Frames deferred by queue_write, transmitted by flush().
+        self._pending = bytearray()
+        # Per-channel command-plus-address prefixes, precomputed so the
+        # hot path builds a frame with one OR and one shift.
+        self._wu_prefix = tuple((CMD_WRITE_AND_UPDATE_DAC << 24) | (c << 20) for c in range(16))
+        self._u_prefix = tuple((CMD_UPDATE_DAC << 24) | (c << 20) for c in range(16))
+        self._wi_prefix = tuple((CMD_WRITE_INPUT_REGISTER << 24) | (c << 20) for c in range(16))
+
+    def batch(self):
+        """Groups SPI operations under one bus lock/configure/CS cycle.
+
+        Usage: ``with dac.batch(): dac.reset(); dac.internal_ref_mode()``
+        """
+        return _Batch(self)
+
+    def _write(self, buffer):
+        """Sends a prebuilt buffer, reusing an open batch device if any."""
+        if self._dev is not None:
+            self._dev.write(buffer)
+        else:
+            with self.spi_device as device:
+                device.write(buffer)
 
     def send_data(self, value):
         """Write a 32-bit value to the DAC via SPI."""
-        buffer = value.to_bytes(4, 'big')  # Convert to 4-byte big-endian
-        with self.spi_device as device:
-            device.write(buffer)
-            #print(buffer)
+        self._pack(self._tx, 0, value)
+        self._write(self._tx)
+
+    def queue_write(self, value):
+        """Defers a 32-bit command until the next flush().
+
+        Queued frames go out as one SPI burst, so the Python work of
+        building the next commands overlaps the point where the bus would
+        otherwise sit idle between per-call transactions. Ports with a
+        DMA-capable SPI peripheral can override flush() to hand the
+        pending buffer to the DMA engine.
+        """
+        self._pack(self._tx, 0, value)
+        self._pending.extend(self._tx)
+
+    def flush(self):
+        """Transmits all queued frames in a single transaction."""
+        if self._pending:
+            self._write(self._pending)
+            self._pending = bytearray()
 
     def write_register(self, channel, data):
         """Writes data to a register)."""
-        command = (CMD_WRITE_INPUT_REGISTER<< 24) | (channel << 20) | (data & 0xFFFFF)
-        self.send_data(command)
+        self.send_data(self._wi_prefix[channel] | (data & 0xFFFFF))
 
     def update_dac(self, channel, data):
         """Writes data to a DAC channel."""
         if channel >= MAX_CHANNELS and channel != DAC_ALL_CHANNELS:
             raise ValueError("Invalid channel")
 
-        # Create a 32-bit register write command
-        command = (CMD_UPDATE_DAC << 24) | (channel << 20) | (data << 8)
-        self.send_data(command)
+        self.send_data(self._u_prefix[channel] | (data << 8))
 
     def write_update_dac(self, channel, data):
         """Writes data to a DAC channel."""
         if channel >= MAX_CHANNELS and channel != DAC_ALL_CHANNELS:
             raise ValueError("Invalid channel")
 
-        # Create a 32-bit register write command
-        command = (CMD_WRITE_AND_UPDATE_DAC << 24) | (channel << 20) | (data << 8)
-        self.send_data(command)
+        self.send_data(self._wu_prefix[channel] | (data << 8))
+
+    def write_update_channels(self, values):
+        """Write-and-update several channels in one SPI transaction.
+
+        values is a mapping of channel to 12-bit code, or a sequence of
+        codes applied to channels 0..N-1. All frames are packed into one
+        buffer and clocked out in a single transfer, so N channel updates
+        cost one CS assert/deassert instead of N.
+        """
+        if isinstance(values, dict):
+            items = values.items()
+        else:
+            items = enumerate(values)
+        buffer = bytearray(4 * len(values))
+        offset = 0
+        for channel, data in items:
+            if channel >= MAX_CHANNELS and channel != DAC_ALL_CHANNELS:
+                raise ValueError("Invalid channel")
+            _pack32(buffer, offset, self._wu_prefix[channel] | ((data & 0xFFF) << 8))
+            offset += 4
+        self._write(buffer)
+
+    def write_all_channels_atomic(self, values):
+        """Loads all 8 input registers in one SPI burst, then commits
+        every output simultaneously.
+
+        values is a sequence of 8 12-bit codes for channels A-H. The
+        input registers load sequentially, but the outputs change on a
+        single event: a hardware LDAC pulse when an ldac pin was given
+        to the constructor, otherwise a software update-all on the last
+        frame.
+        """
+        if len(values) != MAX_CHANNELS:
+            raise ValueError("Expected one value per channel")
+        buffer = bytearray(4 * MAX_CHANNELS)
+        for channel, data in enumerate(values):
+            _pack32(buffer, 4 * channel, self._wi_prefix[channel] | ((data & 0xFFF) << 8))
+        if self.ldac is None:
+            # Software LDAC: the final frame becomes "write to input
+            # register n, update all", committing every channel at once.
+            command = (CMD_WRITE_INPUT_UPDATE_ALL << 24) | ((MAX_CHANNELS - 1) << 20) | ((values[-1] & 0xFFF) << 8)
+            _pack32(buffer, 4 * (MAX_CHANNELS - 1), command)
+            self._write(buffer)
+        else:
+            self._write(buffer)
+            self.ldac.value = False
+            self.ldac.value = True
 
     def tester(self):
         command = (0x03 << 24) | (0x00 << 20) | (0xFFF << 8)
@@ -94,8 +223,7 @@ class AD5628:
 
     def power_down(self):
         """Powers down a specific DAC channel."""
-        command = (CMD_POWER_DOWN << 24) 
-        self.send_data(command)
+        self._write(self._PWRDN_CMD)
 
     def load_clear_code(self, code):
         """Loads the clear code register."""
@@ -121,11 +249,9 @@ class AD5628:
 
     def reset(self):
         """Resets the DAC to power-on defaults."""
-        command = CMD_RESET << 24
-        self.send_data(command)
+        self._write(self._RESET_CMD)
 
     def internal_ref_mode(self):
         """Sets the internal reference mode."""
-        command = (0x08 << 24) | (0x01 << 8)
-        self.send_data(command)
+        self._write(self._IREF_ON_CMD)
 
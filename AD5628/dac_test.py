@@ -1,4 +1,4 @@
-mport board
+import board
 import busio
 import AD5628
 import time
@@ -12,5 +12,4 @@ dac = AD5628.AD5628(spi,cs)
 
 dac.reset()
 dac.internal_ref_mode()
-dac.write_register(0x0F, 0xFFF)
-
+dac.write_update_channels([0xFFF] * AD5628.MAX_CHANNELS)
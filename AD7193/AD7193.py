@@ -1,9 +1,43 @@
 import board
 import busio
+import struct
 from digitalio import DigitalInOut
 from adafruit_bus_device.spi_device import SPIDevice
 import time
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+# Single cached Struct for 32-bit frames; avoids per-call format parsing
+# and attribute lookups inside the struct module.
+_U32 = struct.Struct('>I')
+_pack32 = _U32.pack_into
+_unpack32 = _U32.unpack_from
+
+# Channel lists for every value of the low configuration byte, precomputed
+# so get_active_channels is a single table lookup instead of a bit loop.
+_ACTIVE_CHANNELS = tuple(
+    tuple(ch for ch in range(8) if byte & (1 << ch)) for byte in range(256)
+)
+
+
+class _Batch:
+    """Context manager keeping a driver's SPI device open across calls."""
+
+    def __init__(self, owner):
+        self._owner = owner
+
+    def __enter__(self):
+        self._owner._dev = self._owner.spi_device.__enter__()
+        return self._owner
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._owner._dev = None
+        return self._owner.spi_device.__exit__(exc_type, exc_val, exc_tb)
+
+
 class AD7193:
     # Register Map
     COMMUNICATIONS_REGISTER = 0x00
@@ -12,21 +46,46 @@ class AD7193:
     CONFIGURATION_REGISTER = 0x02
     DATA_REGISTER = 0x03
 
+    # Prebuilt reset frame: 40 consecutive 1 bits.
+    _RESET_CMD = bytes([0xFF] * 5)
+
+    # Mode register DAT_STA bit: append the status register to every
+    # data-register read.
+    _DAT_STA = 0x100000
+
     # SPI Settings
     SPI_MODE = 3  # CPOL = 1, CPHA = 1
-    SPI_BAUDRATE = 1000000  # 1 MHz (adjustable up to 10 MHz max)
-    MAX_SCLK_PERIOD_NS = 100  # Max SCLK period for proper operation
+    SPI_BAUDRATE = 5000000  # 5 MHz default; part is rated to 10 MHz
+    MAX_SCLK_PERIOD_NS = 100  # Min SCLK period 100 ns, i.e. 10 MHz max
 
-    def __init__(self, spi, cs_pin):
+    def __init__(self, spi, cs_pin, drdy_pin=None, baudrate=SPI_BAUDRATE):
         self.cs = DigitalInOut(cs_pin)
         self.cs.switch_to_output(value=True)  # CS high initially
-        self.spi_device = SPIDevice(spi, self.cs, baudrate=self.SPI_BAUDRATE, polarity=1, phase=1)
+        # Optional DOUT/RDY pin: goes low when a conversion is ready,
+        # letting us wait on a GPIO read instead of polling the status
+        # register over SPI.
+        if drdy_pin is not None:
+            self.drdy = DigitalInOut(drdy_pin)
+            self.drdy.switch_to_input()
+        else:
+            self.drdy = None
+        self.spi_device = SPIDevice(spi, self.cs, baudrate=baudrate, polarity=1, phase=1)
+        # Reused transmit buffers so register access never allocates.
+        self._tx = bytearray(4)
+        # Full-duplex read buffers, cached per transfer length.
+        self._read_bufs = {}
+        # Set while a batch() is active; primitives reuse it instead of
+        # re-entering the SPI device per call.
+        self._dev = None
+        # 4-byte sample buffer (MSB stays zero) decoded with a cached
+        # Struct; faster than int.from_bytes on a 3-byte slice.
+        self._sample_buf = bytearray(4)
+        self._unpack_sample = _unpack32
 
     def reset(self):
         """Performs a reset on the AD7193."""
-        reset_command = bytes([0xFF] * 5)  # 40 consecutive 1 bits
         with self.spi_device as spi:
-            spi.write(reset_command)
+            spi.write(self._RESET_CMD)
         time.sleep(0.01)  # Allow time for the device to reset
         print("ADC reset complete.")
 
@@ -36,37 +95,157 @@ class AD7193:
         print(f"Device ID: {device_id:#04X}")
         return device_id
 
-    def write_register(self, register, value):
-        """Writes to a register."""
+    def batch(self):
+        """Groups SPI operations under one bus lock/configure/CS cycle.
+
+        Usage: ``with adc.batch(): adc.write_register(...); ...``
+        """
+        return _Batch(self)
+
+    def write_register(self, register, value, length=3):
+        """Writes an integer value of the given byte length to a register."""
         command = (register << 3) & 0xF8  # Write operation
-        data = bytes([command]) + value
-        with self.spi_device as spi:
-            spi.write(data)
+        # Left-align command + value in the 4-byte buffer and send only
+        # the 1 + length bytes that make up the frame.
+        word = ((command << (8 * length)) | (value & ((1 << (8 * length)) - 1)))
+        _pack32(self._tx, 0, word << (8 * (3 - length)))
+        if self._dev is not None:
+            self._dev.write(self._tx, end=1 + length)
+        else:
+            with self.spi_device as spi:
+                spi.write(self._tx, end=1 + length)
 
     def read_register(self, register, length):
         """Reads from a register."""
-        command = ((register << 3) | 0x40) & 0xFF  # Read operation
-        buffer = bytearray(length)
-        with self.spi_device as spi:
-            spi.write(bytes([command]))
-            spi.readinto(buffer)
-        return buffer
+        bufs = self._read_bufs.get(length)
+        if bufs is None:
+            # Command byte plus payload, clocked in a single full-duplex
+            # transfer; the first response byte (clocked during the
+            # command) is discarded via the memoryview below.
+            tx = bytearray(1 + length)
+            rx = bytearray(1 + length)
+            bufs = self._read_bufs[length] = (tx, rx, memoryview(rx))
+        tx, rx, view = bufs
+        tx[0] = ((register << 3) | 0x40) & 0xFF  # Read operation
+        if self._dev is not None:
+            self._dev.write_readinto(tx, rx)
+        else:
+            with self.spi_device as spi:
+                spi.write_readinto(tx, rx)
+        return view[1:]
 
     def initialize(self):
         """Initializes the ADC."""
-        # Example: Set continuous conversion mode
         mode_value = 0x080060  # Continuous conversion, default settings
-        self.write_register(self.MODE_REGISTER, mode_value.to_bytes(3, 'big'))
-
-        # Example: Set gain, unipolar/bipolar, and channel
         config_value = 0x000117  # Gain = 1, bipolar mode, channel 0
-        self.write_register(self.CONFIGURATION_REGISTER, config_value.to_bytes(3, 'big'))
+        # The communications register re-arms after each write payload,
+        # so both command+data frames can go out as one 8-byte transfer.
+        buf = bytearray(8)
+        _pack32(buf, 0, (((self.MODE_REGISTER << 3) & 0xF8) << 24) | mode_value)
+        _pack32(buf, 4, (((self.CONFIGURATION_REGISTER << 3) & 0xF8) << 24) | config_value)
+        with self.spi_device as spi:
+            spi.write(buf)
+
+    def enable_continuous_read(self):
+        """Locks the data register as the read target (continuous read).
+
+        After this, consecutive reads on DOUT return conversion results
+        without re-sending the communications-register command.
+        """
+        self._tx[0] = 0x5C  # CREAD = 1, read data register
+        with self.spi_device as spi:
+            spi.write(self._tx, end=1)
+
+    def disable_continuous_read(self):
+        """Exits continuous read mode (write while DOUT/RDY is low)."""
+        self._tx[0] = 0x58  # CREAD = 0
+        with self.spi_device as spi:
+            spi.write(self._tx, end=1)
+
+    def stream_samples(self, count, out=None):
+        """Reads count consecutive 3-byte samples in continuous read mode.
+
+        Requires enable_continuous_read() first. All samples are clocked
+        inside one CS-low window with no command bytes, so count samples
+        cost 3*count bus bytes instead of 4*count plus count CS toggles.
+        Returns the raw sample buffer.
+        """
+        if out is None:
+            out = bytearray(3 * count)
+        view = memoryview(out)
+        with self.spi_device as spi:
+            for i in range(count):
+                spi.readinto(view[3 * i:3 * i + 3])
+        return out
+
+    def enable_status_append(self):
+        """Sets DAT_STA so every data read carries a trailing status byte.
+
+        With this armed, streamed samples include their RDY flag and
+        channel number, so no separate status-register transactions are
+        needed per sample.
+        """
+        mode = int.from_bytes(self.read_register(self.MODE_REGISTER, 3), 'big')
+        self.write_register(self.MODE_REGISTER, mode | self._DAT_STA)
+
+    def acquire_samples_with_status(self, count, out=None):
+        """Acquires count (channel, value) pairs in one tight inner loop.
+
+        Requires enable_status_append() and enable_continuous_read()
+        first. Each sample is a single 4-byte read (3 data bytes plus the
+        appended status byte), replacing the data-ready poll, channel
+        read and data read of the unbatched path with one transaction.
+        """
+        if out is None:
+            out = [None] * count
+        raw = bytearray(4)
+        view = memoryview(raw)
+        unpack = self._unpack_sample
+        drdy = self.drdy
+        with self.spi_device as spi:
+            readinto = spi.readinto
+            for i in range(count):
+                if drdy is not None:
+                    while drdy.value:
+                        pass
+                readinto(view)
+                word = unpack(raw)[0]
+                # Data occupies the high 24 bits; CHD3:CHD0 sit in the
+                # trailing status byte.
+                out[i] = (word & 0x0F, word >> 8)
+        return out
+
+    def acquire_samples(self, count, out=None):
+        """Acquires count decoded samples in one tight inner loop.
+
+        Requires enable_continuous_read() first. The DRDY pin, SPI
+        readinto and sample buffer are hoisted into locals so interpreter
+        dispatch is amortized over the burst instead of paid per sample
+        through the public helpers. Fills and returns a list of ints.
+        """
+        if out is None:
+            out = [0] * count
+        buf = self._sample_buf
+        view = memoryview(buf)[1:4]  # byte 0 stays zero for the unpack
+        unpack = self._unpack_sample
+        drdy = self.drdy
+        with self.spi_device as spi:
+            readinto = spi.readinto
+            for i in range(count):
+                if drdy is not None:
+                    # In continuous read mode DOUT/RDY frames each
+                    # conversion while CS stays low.
+                    while drdy.value:
+                        pass
+                readinto(view)
+                out[i] = unpack(buf)[0]
+        return out
 
     def read_data(self):
         """Reads data from the data register."""
-        data = self.read_register(self.DATA_REGISTER, 3)
-        # Convert the 3-byte response to an integer
-        return int.from_bytes(data, 'big')
+        buf = self._sample_buf
+        buf[1:4] = self.read_register(self.DATA_REGISTER, 3)
+        return self._unpack_sample(buf)[0]
 
     def data_ready(self):
         """Checks if data is ready using the status register."""
@@ -76,11 +255,37 @@ class AD7193:
     def wait_for_data_ready(self, timeout=1.0):
         """Waits for data to be ready or times out."""
         start = time.monotonic()
+        if self.drdy is not None:
+            # DOUT/RDY is driven low when a conversion completes; a pin
+            # read costs far less than a status-register SPI transaction
+            # and leaves the bus free.
+            while self.drdy.value:
+                if (time.monotonic() - start) > timeout:
+                    raise TimeoutError("Timeout waiting for data ready")
+            return
         while not self.data_ready():
             if (time.monotonic() - start) > timeout:
                 raise TimeoutError("Timeout waiting for data ready")
             time.sleep(0.001)  # Poll every 1 ms
 
+    async def read_sample(self):
+        """Awaits the next conversion without blocking the scheduler.
+
+        Unlike wait_for_data_ready, the busy time is yielded back to the
+        asyncio event loop: with a DRDY pin the coroutine checks the GPIO
+        once per scheduler tick, otherwise it polls the status register
+        between 1 ms sleeps. Returns the decoded sample.
+        """
+        if asyncio is None:
+            raise RuntimeError("asyncio is not available on this port")
+        if self.drdy is not None:
+            while self.drdy.value:
+                await asyncio.sleep(0)
+        else:
+            while not self.data_ready():
+                await asyncio.sleep(0.001)
+        return self.read_data()
+
     def get_active_channel(self):
         """Reads the status register to determine the current channel."""
         status = self.read_register(self.STATUS_REGISTER, 1)[0]
@@ -90,11 +295,7 @@ class AD7193:
     def get_active_channels(self):
         """Reads the configuration register to determine all active channels."""
         config = int.from_bytes(self.read_register(self.CONFIGURATION_REGISTER, 3), 'big')
-        active_channels = []
-        for channel in range(8):  # Check CH7 to CH0
-            if config & (1 << channel):
-                active_channels.append(channel)
-        return active_channels
+        return list(_ACTIVE_CHANNELS[config & 0xFF])
 
     def get_mode(self):
         """Checks if the ADC is in differential or pseudo-differential mode."""
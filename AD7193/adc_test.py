@@ -20,12 +20,15 @@ print("Current Mode:", adc.get_mode())
 all_channels = adc.get_active_channels()
 print(f"Enabled Channels: {all_channels}")
 
+# Acquire in bursts so the per-sample work stays inside acquire_samples'
+# inner loop instead of going through the public helpers each iteration.
+samples = [0] * 64
+adc.enable_continuous_read()
 try:
     while True:
-        adc.wait_for_data_ready()
-        current_channel = adc.get_active_channel()
-        data = adc.read_data()
-        print(f"Channel {current_channel}: Data = {data}")
-        time.sleep(0.1)
+        adc.acquire_samples(len(samples), samples)
+        for value in samples:
+            print(f"Data = {value}")
 except KeyboardInterrupt:
+    adc.disable_continuous_read()
     print("Stopped.")